@@ -7,13 +7,148 @@ This script provides a specialized version of LatexNodes2Text with custom rules
 for converting LaTeX expressions to text with random variations.
 """
 
+import functools
 import random
 import re
 from pylatexenc.latexwalker import LatexWalker
+from pylatexenc.latexnodes.parsers import LatexGeneralNodesParser
 from pylatexenc.latex2text import LatexNodes2Text, MacroTextSpec, EnvironmentTextSpec, SpecialsTextSpec, get_default_latex_context_db
+from pylatexenc.latex2text import _math_space_macros, _strict_latex_spaces_predef
 from pylatexenc.macrospec import MacroSpec, std_macro
 
 
+# The general nodes parser keeps no state between parses; share one instance
+_GENERAL_NODES_PARSER = LatexGeneralNodesParser()
+
+# Uniform draw used for the weighted random choices below
+_rand = random.random
+
+
+# Greek letter names to symbols
+_GREEK_LETTERS = {
+    'alpha': 'α', 'beta': 'β', 'gamma': 'γ', 'delta': 'δ', 'epsilon': 'ε',
+    'varepsilon': 'ϵ', 'zeta': 'ζ', 'eta': 'η', 'theta': 'θ', 'vartheta': 'ϑ',
+    'iota': 'ι', 'kappa': 'κ', 'varkappa': 'ϰ', 'lambda': 'λ', 'mu': 'μ',
+    'nu': 'ν', 'xi': 'ξ', 'varpi': 'ϖ', 'rho': 'ρ', 'varrho': 'ϱ',
+    'sigma': 'σ', 'varsigma': 'ς', 'tau': 'τ', 'upsilon': 'υ', 'phi': 'φ',
+    'varphi': 'ϕ', 'chi': 'χ', 'psi': 'ψ', 'omega': 'ω',
+    'Gamma': 'Γ', 'Delta': 'Δ', 'Theta': 'Θ', 'Lambda': 'Λ', 'Xi': 'Ξ',
+    'Pi': 'Π', 'Sigma': 'Σ', 'Upsilon': 'Υ', 'Phi': 'Φ', 'Psi': 'Ψ', 'Omega': 'Ω'
+}
+
+# Greek letter name -> (spelled out, symbol), indexed by `_rand() >= 0.8`
+_GREEK_CHOICE = {name: (name, symbol) for name, symbol in _GREEK_LETTERS.items()}
+
+# A macro call with the whitespace that follows it (alphabetic macros only);
+# same name rules as LatexTokenReader
+_MACRO_TOKEN_RE = re.compile(r'\\(?:([A-Za-z]+)(\s*)|(.))', re.DOTALL)
+
+# Operators (and spaces) that make an expression need parentheses
+_OPS_RE = re.compile(r'[ +\-*/^]')
+
+
+def _needs_parentheses(text):
+    """Check if text needs parentheses (has multiple elements/operators)"""
+    return _OPS_RE.search(text) is not None
+
+
+def _format_power(content, exp_value):
+    """Format `content` raised to `exp_value`, with a random power operator."""
+    exp_op = '^' if _rand() < 0.5 else '**'
+    base = f"({content})" if _needs_parentheses(content) else content
+    return f"{base}{exp_op}{exp_value}"
+
+
+def _short_reciprocal(radicand):
+    """Return str(1/radicand) if it has at most 5 decimal places, else None."""
+    inv_radicand = 1.0 / radicand
+    # Check decimal places without formatting the float
+    scaled = inv_radicand * 100000
+    if abs(scaled - round(scaled)) < 1e-9:
+        return str(inv_radicand)
+    return None
+
+
+# Precomputed _short_reciprocal() for the usual small integer root indices
+_INV_ROOT_STR = {n: _short_reciprocal(n) for n in range(1, 101)}
+
+
+def _pick_sqrt_exp(root_index, radicand):
+    """Choose the exponent text for the root of index `root_index`."""
+    if radicand is not None:
+        if radicand in _INV_ROOT_STR:
+            inv_str = _INV_ROOT_STR[radicand]
+        else:
+            try:
+                inv_str = _short_reciprocal(radicand)
+            except (ZeroDivisionError, OverflowError, ValueError):
+                return f"(1/{root_index})"
+        use_decimal = _rand() < 0.5
+
+        if inv_str is not None and use_decimal:
+            return inv_str
+    return f"(1/{root_index})"
+
+
+# Groups of macros that share the same text conversion
+_FRACS = frozenset({'frac', 'dfrac', 'tfrac'})
+_TEXT_FMT = frozenset({'text', 'textbf', 'textit'})
+_SUMS = frozenset({'sum', 'int', 'lim', 'prod', 'nabla', 'iint', 'iiint', 'oint'})
+_PASSTHROUGH_FUNCS = frozenset({'sin', 'cos', 'tan', 'log', 'ln'})
+
+# Macro parsing specifications (for argument parsing)
+_CUSTOM_MACRO_SPECS = [
+    # Square root: optional argument [n] + mandatory argument {x}
+    std_macro('sqrt', '[{'),
+
+    # Fractions: 2 mandatory arguments {numerator}{denominator}
+    std_macro('frac', '{{'),
+    std_macro('dfrac', '{{'),
+    std_macro('tfrac', '{{'),
+
+    # Binomial coefficient: 2 mandatory arguments {n}{k}
+    std_macro('binom', '{{'),
+
+    # Mathematical functions with one argument
+    std_macro('mathrm', '{'),
+    std_macro('log', ''),  # \log can be used without arguments
+    std_macro('ln', ''),   # \ln can be used without arguments  
+    std_macro('sin', ''),  # \sin can be used without arguments
+    std_macro('cos', ''),  # \cos can be used without arguments
+    std_macro('tan', ''),  # \tan can be used without arguments
+    std_macro('lim', ''),  # \lim can be used without arguments
+    std_macro('text', '{'),
+    std_macro('textbf', '{'),
+    std_macro('textit', '{'),
+    std_macro('boxed', '{'),
+
+    # Greek letters (no arguments, but need MacroSpec to override defaults)
+] + [std_macro(name, '') for name in [
+    'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'varepsilon', 'zeta', 'eta',
+    'theta', 'vartheta', 'iota', 'kappa', 'varkappa', 'lambda', 'mu', 'nu',
+    'xi', 'pi', 'varpi', 'rho', 'varrho', 'sigma', 'varsigma', 'tau',
+    'upsilon', 'phi', 'varphi', 'chi', 'psi', 'omega',
+    'Gamma', 'Delta', 'Theta', 'Lambda', 'Xi', 'Pi', 'Sigma',
+    'Upsilon', 'Phi', 'Psi', 'Omega',
+    # Other symbols that might have default MacroTextSpec
+    'infty', 'times', 'cdot', 'pm', 'mp', 'approx', 'sim', 'equiv',
+    'subseteq', 'iff', 'mapsto', 'ldots', 'cdots', 'dots',
+    # Mathematical operators and relations
+    'leq', 'geq', 'neq', 'div', 'subset', 'in', 'cup', 'cap', 'emptyset',
+    'to', 'quad', 'qquad', 'sum', 'int', 'lim', 'prod', 'nabla',
+    'iint', 'iiint', 'oint', 'mathbb', 'left', 'right', '\\',
+    '{', '}', # Literal braces
+    'n', # For \n newlines
+]]
+
+# Custom specials specifications
+_CUSTOM_SPECIALS = [
+    # Angle brackets
+    SpecialsTextSpec('\\langle', '<'),
+    SpecialsTextSpec('\\rangle', '>'),
+]
+
+
 class CustomLatexNodes2Text(LatexNodes2Text):
     """
     Specialized LatexNodes2Text class with custom formatting variations.
@@ -44,52 +179,45 @@ class CustomLatexNodes2Text(LatexNodes2Text):
         
         # Initialize parent with our custom context
         super().__init__(latex_context=latex_context, **kwargs)
+
+        # Matches anything that could make the text differ from the input:
+        # macros, math, comments, groups, and the specials of our context
+        markup = ['\\', '$', '%', '{', '}'] + [
+            spec.specials_chars for spec in latex_context.iter_specials_specs()
+        ]
+        self._latex_markup_re = re.compile('|'.join(re.escape(m) for m in markup))
+
+        # Tables of macro name -> replacement, built once per converter
+        self._macro_constants = self._get_constant_replacements()
+        self._macro_handlers = self._get_macro_handlers()
+
+        # Input consisting of a single argument-less macro, e.g. r'\alpha',
+        # maps directly to its replacement (a string, or a symbol handler that
+        # does not look at the node) without running the parser
+        self._lone_macros = {
+            '\\' + name: text for name, text in self._macro_constants.items()
+        }
+        for name in ['pi', 'infty'] + list(_GREEK_LETTERS):
+            self._lone_macros['\\' + name] = self._macro_handlers[name]
+
+        # Argument-less macros with a fixed replacement.  Text mixing only
+        # these with plain text is converted by substitution, reproducing the
+        # spacing nodelist_to_text() puts after bare macros.
+        self._simple_macros = {}
+        if not self.fill_text and \
+           not self.strict_latex_spaces['between-macro-and-chars']:
+            for name, text in self._macro_constants.items():
+                spec = latex_context.get_macro_spec(name)
+                if spec is not None and not spec.arguments_spec_list:
+                    self._simple_macros[name] = text
+        if self.strict_latex_spaces == _strict_latex_spaces_predef['math-all-spaces']:
+            self._space_after_macros = _math_space_macros
+        else:
+            self._space_after_macros = frozenset()
     
     def _get_custom_macro_specs(self):
         """Get macro parsing specifications for macros that take arguments."""
-        return [
-            # Square root: optional argument [n] + mandatory argument {x}
-            std_macro('sqrt', '[{'),
-            
-            # Fractions: 2 mandatory arguments {numerator}{denominator}
-            std_macro('frac', '{{'),
-            std_macro('dfrac', '{{'),
-            std_macro('tfrac', '{{'),
-            
-            # Binomial coefficient: 2 mandatory arguments {n}{k}
-            std_macro('binom', '{{'),
-            
-            # Mathematical functions with one argument
-            std_macro('mathrm', '{'),
-            std_macro('log', ''),  # \log can be used without arguments
-            std_macro('ln', ''),   # \ln can be used without arguments  
-            std_macro('sin', ''),  # \sin can be used without arguments
-            std_macro('cos', ''),  # \cos can be used without arguments
-            std_macro('tan', ''),  # \tan can be used without arguments
-            std_macro('lim', ''),  # \lim can be used without arguments
-            std_macro('text', '{'),
-            std_macro('textbf', '{'),
-            std_macro('textit', '{'),
-            std_macro('boxed', '{'),
-            
-            # Greek letters (no arguments, but need MacroSpec to override defaults)
-        ] + [std_macro(name, '') for name in [
-            'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'varepsilon', 'zeta', 'eta',
-            'theta', 'vartheta', 'iota', 'kappa', 'varkappa', 'lambda', 'mu', 'nu',
-            'xi', 'pi', 'varpi', 'rho', 'varrho', 'sigma', 'varsigma', 'tau',
-            'upsilon', 'phi', 'varphi', 'chi', 'psi', 'omega',
-            'Gamma', 'Delta', 'Theta', 'Lambda', 'Xi', 'Pi', 'Sigma',
-            'Upsilon', 'Phi', 'Psi', 'Omega',
-            # Other symbols that might have default MacroTextSpec
-            'infty', 'times', 'cdot', 'pm', 'mp', 'approx', 'sim', 'equiv',
-            'subseteq', 'iff', 'mapsto', 'ldots', 'cdots', 'dots',
-            # Mathematical operators and relations
-            'leq', 'geq', 'neq', 'div', 'subset', 'in', 'cup', 'cap', 'emptyset',
-            'to', 'quad', 'qquad', 'sum', 'int', 'lim', 'prod', 'nabla',
-            'iint', 'iiint', 'oint', 'mathbb', 'left', 'right', '\\',
-            '{', '}', # Literal braces
-            'n', # For \n newlines
-        ]]
+        return _CUSTOM_MACRO_SPECS
     
     def _get_custom_text_specs(self):
         """Get custom text specifications for simple macros (no argument parsing needed)."""
@@ -128,138 +256,61 @@ class CustomLatexNodes2Text(LatexNodes2Text):
     
     def _get_custom_specials(self):
         """Get custom specials specifications."""
-        return [
-            # Angle brackets
-            SpecialsTextSpec('\\langle', '<'),
-            SpecialsTextSpec('\\rangle', '>'),
-        ]
+        return _CUSTOM_SPECIALS
+    
+    def _arg_to_text(self, arg):
+        """
+        Convert a single macro argument node to text.
+
+        Same result as ``nodelist_to_text([arg])``, without wrapping the
+        argument in a temporary list.
+        """
+        return self.node_to_text(arg)
     
     def _custom_sqrt_handler(self, node, l2tobj):
         """Custom handler for sqrt macro with random variations."""
         if not node.nodeargd or not node.nodeargd.argnlist:
             return ""
-        
-        def needs_parentheses(text):
-            """Check if text needs parentheses (has multiple elements/operators)"""
-            operators = ['+', '-', '*', '/', '^', ' ']
-            return any(op in text for op in operators)
+        argnlist = node.nodeargd.argnlist
         
         # Random choice for sqrt format
-        sqrt_rng = random.randint(0, 1)
+        use_sqrt = _rand() < 0.5
         
         # Get the arguments correctly
-        if len(node.nodeargd.argnlist) >= 1:
-            # Check if we have an optional argument (for nth root)
-            if len(node.nodeargd.argnlist) >= 2:
-                # Has optional argument [n] and mandatory argument {x}
-                if node.nodeargd.argnlist[0] is not None:
-                    # nth root
-                    root_index = l2tobj.nodelist_to_text([node.nodeargd.argnlist[0]])
-                    content = l2tobj.nodelist_to_text([node.nodeargd.argnlist[1]])
-                    
-                    # Parse root index as number
-                    try:
-                        radicand = float(root_index)
-                    except (ValueError, TypeError):
-                        radicand = None
-
-                    if radicand == 2 and sqrt_rng == 0:
-                        return f"sqrt({content})"
-                    else:
-                        # Random choice for exponent format
-                        exp_rng = random.randint(0, 1)
-                        
-                        if radicand is not None:
-                            try:
-                                inv_radicand = 1.0 / radicand
-                                # Check decimal places
-                                decimal_part = str(inv_radicand).split('.')[1] if '.' in str(inv_radicand) else ""
-                                decimal_rng = random.randint(0, 1)
-                                
-                                if len(decimal_part) <= 5 and decimal_rng == 0:
-                                    exp_value = str(inv_radicand)
-                                else:
-                                    exp_value = f"(1/{root_index})"
-                            except (ZeroDivisionError, ValueError):
-                                exp_value = f"(1/{root_index})"
-                        else:
-                            exp_value = f"(1/{root_index})"
-
-                        if needs_parentheses(content):
-                            if exp_rng == 0:
-                                return f"({content})^{exp_value}"
-                            else:
-                                return f"({content})**{exp_value}"
-                        else:
-                            if exp_rng == 0:
-                                return f"{content}^{exp_value}"
-                            else:
-                                return f"{content}**{exp_value}"
-                else:
-                    # Optional argument is None, so just square root
-                    content = l2tobj.nodelist_to_text([node.nodeargd.argnlist[1]])
-                    if sqrt_rng == 0:
-                        return f"sqrt({content})"
-                    else:
-                        exp_rng = random.randint(0, 1)
-                        decimal_rng = random.randint(0, 1)
-
-                        if decimal_rng == 0:
-                            exp_value = "0.5"
-                        else:
-                            exp_value = "(1/2)"
-
-                        if needs_parentheses(content):
-                            if exp_rng == 0:
-                                return f"({content})^{exp_value}"
-                            else:
-                                return f"({content})**{exp_value}"
-                        else:
-                            if exp_rng == 0:
-                                return f"{content}^{exp_value}"
-                            else:
-                                return f"{content}**{exp_value}"
+        if len(argnlist) >= 2 and argnlist[0] is not None:
+            # Has optional argument [n] and mandatory argument {x}: nth root
+            root_index = l2tobj._arg_to_text(argnlist[0])
+            content = l2tobj._arg_to_text(argnlist[1])
+
+            # Parse root index as number; usually a small integer
+            if root_index.isdecimal():
+                radicand = int(root_index)
             else:
-                # No optional argument, just sqrt{x} => sqrt(x) or (x)^(1/2)
-                content = l2tobj.nodelist_to_text([node.nodeargd.argnlist[0]])
-                if sqrt_rng == 0:
-                    return f"sqrt({content})"
-                else:
-                    exp_rng = random.randint(0, 1)
-                    decimal_rng = random.randint(0, 1)
-
-                    if decimal_rng == 0:
-                        exp_value = "0.5"
-                    else:
-                        exp_value = "(1/2)"
-
-                    if needs_parentheses(content):
-                        if exp_rng == 0:
-                            return f"({content})^{exp_value}"
-                        else:
-                            return f"({content})**{exp_value}"
-                    else:
-                        if exp_rng == 0:
-                            return f"{content}^{exp_value}"
-                        else:
-                            return f"{content}**{exp_value}"
-        return ""
+                try:
+                    radicand = float(root_index)
+                except (ValueError, TypeError):
+                    radicand = None
+        else:
+            # No (or empty) optional argument, just sqrt{x} => sqrt(x) or (x)^(1/2)
+            content = l2tobj._arg_to_text(argnlist[-1])
+            root_index = '2'
+            radicand = 2.0
+
+        if radicand == 2 and use_sqrt:
+            return f"sqrt({content})"
+
+        return _format_power(content, _pick_sqrt_exp(root_index, radicand))
     
     def _custom_frac_handler(self, node, l2tobj):
         """Custom handler for fractions with parentheses for complex expressions."""
         if not node.nodeargd or len(node.nodeargd.argnlist) < 2:
             return ""
         
-        numerator = l2tobj.nodelist_to_text([node.nodeargd.argnlist[0]])
-        denominator = l2tobj.nodelist_to_text([node.nodeargd.argnlist[1]])
+        numerator = l2tobj._arg_to_text(node.nodeargd.argnlist[0])
+        denominator = l2tobj._arg_to_text(node.nodeargd.argnlist[1])
         
-        # Add parentheses for complex expressions
-        def is_complex(text):
-            """Check if expression is complex (contains operators or multiple terms)"""
-            operators = ['+', '-', '*', '/', '^', ' ']
-            return any(op in text.strip() for op in operators)
-        
-        if is_complex(numerator) or is_complex(denominator):
+        # Add parentheses for complex expressions (operators or multiple terms)
+        if _needs_parentheses(numerator.strip()) or _needs_parentheses(denominator.strip()):
             return f"({numerator})/({denominator})"
         else:
             return f"{numerator}/{denominator}"
@@ -269,8 +320,8 @@ class CustomLatexNodes2Text(LatexNodes2Text):
         if not node.nodeargd or len(node.nodeargd.argnlist) < 2:
             return ""
         
-        n = l2tobj.nodelist_to_text([node.nodeargd.argnlist[0]])
-        k = l2tobj.nodelist_to_text([node.nodeargd.argnlist[1]])
+        n = l2tobj._arg_to_text(node.nodeargd.argnlist[0])
+        k = l2tobj._arg_to_text(node.nodeargd.argnlist[1])
         
         return f"C({n},{k})"
     
@@ -279,7 +330,7 @@ class CustomLatexNodes2Text(LatexNodes2Text):
         if not node.nodeargd or not node.nodeargd.argnlist:
             return ""
         
-        content = l2tobj.nodelist_to_text([node.nodeargd.argnlist[0]])
+        content = l2tobj._arg_to_text(node.nodeargd.argnlist[0])
         
         # Special case for 'e' (Euler's number)
         if content.strip() == 'e':
@@ -293,187 +344,267 @@ class CustomLatexNodes2Text(LatexNodes2Text):
         if not node.nodeargd or not node.nodeargd.argnlist:
             return ""
         
-        content = l2tobj.nodelist_to_text([node.nodeargd.argnlist[0]])
+        content = l2tobj._arg_to_text(node.nodeargd.argnlist[0])
         return f"[{content}]"
     
     def _custom_infty_handler(self, node, l2tobj):
         """Custom handler for infinity symbol with random choice."""
-        choices = ['infinity', 'inf', '∞']
-        weights = [0.4, 0.4, 0.2]  # 40% infinity, 40% inf, 20% symbol
-        return random.choices(choices, weights=weights)[0]
+        r = _rand()  # 40% infinity, 40% inf, 20% symbol
+        if r < 0.4:
+            return 'infinity'
+        if r < 0.8:
+            return 'inf'
+        return '∞'
     
     def _custom_pi_handler(self, node, l2tobj):
         """Custom handler for pi symbol with random choice."""
-        choices = ['pi', 'π']
-        weights = [0.8, 0.2]  # 80% pi, 20% symbol
-        return random.choices(choices, weights=weights)[0]
+        return 'pi' if _rand() < 0.8 else 'π'  # 80% pi, 20% symbol
     
     def _greek_letters(self):
         """Return a dictionary of Greek letter names to symbols."""
-        return {
-            'alpha': 'α', 'beta': 'β', 'gamma': 'γ', 'delta': 'δ', 'epsilon': 'ε',
-            'varepsilon': 'ϵ', 'zeta': 'ζ', 'eta': 'η', 'theta': 'θ', 'vartheta': 'ϑ',
-            'iota': 'ι', 'kappa': 'κ', 'varkappa': 'ϰ', 'lambda': 'λ', 'mu': 'μ',
-            'nu': 'ν', 'xi': 'ξ', 'varpi': 'ϖ', 'rho': 'ρ', 'varrho': 'ϱ',
-            'sigma': 'σ', 'varsigma': 'ς', 'tau': 'τ', 'upsilon': 'υ', 'phi': 'φ',
-            'varphi': 'ϕ', 'chi': 'χ', 'psi': 'ψ', 'omega': 'ω',
-            'Gamma': 'Γ', 'Delta': 'Δ', 'Theta': 'Θ', 'Lambda': 'Λ', 'Xi': 'Ξ',
-            'Pi': 'Π', 'Sigma': 'Σ', 'Upsilon': 'Υ', 'Phi': 'Φ', 'Psi': 'Ψ', 'Omega': 'Ω'
-        }
+        return _GREEK_LETTERS
     
     def _get_greek_letter_text(self, name):
         """Get the text representation of a Greek letter with random choice."""
-        symbol = self._greek_letters().get(name, name)
-        choices = [name, symbol]
-        weights = [0.8, 0.2]  # 80% spelled out, 20% symbol
-        return random.choices(choices, weights=weights)[0]
+        # 80% spelled out, 20% symbol
+        return _GREEK_CHOICE.get(name, (name, name))[_rand() >= 0.8]
     
     def _custom_greek_handler(self, name, symbol):
         """Create a handler for Greek letters with random choice."""
+        choice = (name, symbol)
         def handler(node, l2tobj):
-            choices = [name, symbol]
-            weights = [0.8, 0.2]  # 80% spelled out, 20% symbol
-            return random.choices(choices, weights=weights)[0]
+            return choice[_rand() >= 0.8]  # 80% spelled out, 20% symbol
         return handler
     
-    def macro_node_to_text(self, node):
-        """Override to handle custom macros and subscripts."""
-        # Handle subscripts specially
-        if node.macroname == '_' and node.nodeargd and node.nodeargd.argnlist:
-            # Convert subscript to underscore notation
-            subscript_content = self.nodelist_to_text([node.nodeargd.argnlist[0]])
-            return f"_({subscript_content})"
-        
-        # Handle custom macros that have parsing specs
-        if node.macroname == 'sqrt':
-            return self._custom_sqrt_handler(node, self)
-        elif node.macroname == 'frac' or node.macroname == 'dfrac' or node.macroname == 'tfrac':
-            return self._custom_frac_handler(node, self)
-        elif node.macroname == 'binom':
-            return self._custom_binom_handler(node, self)
-        elif node.macroname == 'mathrm':
-            return self._custom_mathrm_handler(node, self)
-        elif node.macroname == 'boxed':
-            return self._custom_boxed_handler(node, self)
-        elif node.macroname in ('text', 'textbf', 'textit'):
-            # Simple text formatting - just return the content
-            if node.nodeargd and node.nodeargd.argnlist:
-                return self.nodelist_to_text([node.nodeargd.argnlist[0]])
+    def _custom_text_handler(self, node, l2tobj):
+        """Custom handler for text formatting macros, keeping only the content."""
+        if not node.nodeargd or not node.nodeargd.argnlist:
             return ""
-        
+        return l2tobj._arg_to_text(node.nodeargd.argnlist[0])
+
+    def _custom_mathbb_handler(self, node, l2tobj):
+        r"""Custom handler for \mathbb, keeping only the letter."""
+        if not node.nodeargd or not node.nodeargd.argnlist:
+            return ""
+        return l2tobj._arg_to_text(node.nodeargd.argnlist[0])
+
+    def _get_macro_handlers(self):
+        """
+        Build the table mapping macro names to handlers, called as
+        ``handler(node, l2tobj)``.
+        """
+        handlers = {}
+
+        # Handle custom macros that have parsing specs
+        handlers['sqrt'] = self._custom_sqrt_handler
+        handlers.update(dict.fromkeys(_FRACS, self._custom_frac_handler))
+        handlers['binom'] = self._custom_binom_handler
+        handlers['mathrm'] = self._custom_mathrm_handler
+        handlers['boxed'] = self._custom_boxed_handler
+        # Simple text formatting - just return the content
+        handlers.update(dict.fromkeys(_TEXT_FMT, self._custom_text_handler))
+        handlers['mathbb'] = self._custom_mathbb_handler
+
         # Handle Greek letters and special symbols
-        elif node.macroname == 'pi':
-            return self._custom_pi_handler(node, self)
-        elif node.macroname == 'infty':
-            return self._custom_infty_handler(node, self)
-        elif node.macroname in self._greek_letters():
-            return self._get_greek_letter_text(node.macroname)
-        
-        # Handle simple operators and symbols
-        elif node.macroname == 'times':
-            return '*'
-        elif node.macroname == 'cdot':
-            return '*'
-        elif node.macroname == 'pm':
-            return '+/-'
-        elif node.macroname == 'mp':
-            return '-/+'
-        elif node.macroname == 'approx':
-            return '~'
-        elif node.macroname == 'sim':
-            return '~='
-        elif node.macroname == 'equiv':
-            return '==='
-        elif node.macroname == 'subseteq':
-            return 'subset='
-        elif node.macroname == 'iff':
-            return '<=>'
-        elif node.macroname == 'mapsto':
-            return '|->'
-        elif node.macroname in ('ldots', 'cdots', 'dots'):
-            return '...'
-        
-        # Handle additional mathematical symbols and operators
-        elif node.macroname == 'leq':
-            return '<='
-        elif node.macroname == 'geq':
-            return '>='
-        elif node.macroname == 'neq':
-            return '!='
-        elif node.macroname == 'div':
-            return '÷'
-        elif node.macroname == 'subset':
-            return '⊂'
-        elif node.macroname == 'in':
-            return '∈'
-        elif node.macroname == 'cup':
-            return '∪'
-        elif node.macroname == 'cap':
-            return '∩'
-        elif node.macroname == 'emptyset':
-            return '∅'
-        elif node.macroname == 'to':
-            return '→'
-        elif node.macroname == 'quad':
-            return '    '  # Four spaces
-        elif node.macroname == 'qquad':
-            return '        '  # Eight spaces
-        elif node.macroname == '\\':
-            return '\n'  # Line break
-        
+        handlers['pi'] = self._custom_pi_handler
+        handlers['infty'] = self._custom_infty_handler
+        for name, symbol in self._greek_letters().items():
+            handlers[name] = self._custom_greek_handler(name, symbol)
+
+        return handlers
+
+    def _get_constant_replacements(self):
+        """
+        Build the table mapping macro names to a fixed replacement string, for
+        macros whose text does not depend on arguments or random choices.
+        """
+        constants = {
+            # Handle simple operators and symbols
+            'times': '*',
+            'cdot': '*',
+            'pm': '+/-',
+            'mp': '-/+',
+            'approx': '~',
+            'sim': '~=',
+            'equiv': '===',
+            'subseteq': 'subset=',
+            'iff': '<=>',
+            'mapsto': '|->',
+            'ldots': '...',
+            'cdots': '...',
+            'dots': '...',
+
+            # Handle additional mathematical symbols and operators
+            'leq': '<=',
+            'geq': '>=',
+            'neq': '!=',
+            'div': '÷',
+            'subset': '⊂',
+            'in': '∈',
+            'cup': '∪',
+            'cap': '∩',
+            'emptyset': '∅',
+            'to': '→',
+            'quad': '    ',  # Four spaces
+            'qquad': '        ',  # Eight spaces
+            '\\': '\n',  # Line break
+
+            # Ignore \left, \right delimiters for now
+            'left': '',
+            'right': '',
+
+            # Handle literal braces
+            '{': '{',
+            '}': '}',
+
+            # Handle \n (newline)
+            'n': '\n',
+        }
+
         # Handle mathematical functions and operators (keep as-is for now)
-        elif node.macroname in ('sum', 'int', 'lim', 'prod', 'nabla', 'iint', 'iiint', 'oint'):
-            return f'\\{node.macroname}'
-        
-        # Handle \mathbb, \left, \right (these need special handling)
-        elif node.macroname == 'mathbb':
-            if node.nodeargd and node.nodeargd.argnlist:
-                content = self.nodelist_to_text([node.nodeargd.argnlist[0]])
-                return content  # Just return the letter without special formatting
-            return ""
-        elif node.macroname in ('left', 'right'):
-            return ""  # Ignore delimiters for now
-        
+        for name in _SUMS:
+            constants[name] = '\\' + name
+
         # Handle mathematical functions
-        elif node.macroname in ('sin', 'cos', 'tan', 'log', 'ln'):
-            return node.macroname
-        
-        # Handle literal braces
-        elif node.macroname == '{':
-            return '{'
-        elif node.macroname == '}':
-            return '}'
-        
-        # Handle \n (newline)
-        elif node.macroname == 'n':
-            return '\n'
-        
+        for name in _PASSTHROUGH_FUNCS:
+            constants[name] = name
+
+        return constants
+
+    def macro_node_to_text(self, node):
+        """Override to handle custom macros and subscripts."""
+        macroname = node.macroname
+
+        # Most macros are plain symbols with a fixed replacement
+        text = self._macro_constants.get(macroname)
+        if text is not None:
+            return text
+
+        # Handle subscripts specially
+        if macroname == '_':
+            nodeargd = node.nodeargd
+            if nodeargd and nodeargd.argnlist:
+                # Convert subscript to underscore notation
+                subscript_content = self._arg_to_text(nodeargd.argnlist[0])
+                return f"_({subscript_content})"
+
+        # Handle custom macros that need their arguments or a random choice
+        handler = self._macro_handlers.get(macroname)
+        if handler is not None:
+            return handler(node, self)
+
         # For everything else, use parent implementation
         return super().macro_node_to_text(node)
     
+    def _is_plain_chars(self, chars):
+        """Check that `chars` has no markup or specials and is not whitespace-only."""
+        return not chars.isspace() and self._latex_markup_re.search(chars) is None
+
+    def _substitute_simple_macros(self, latex):
+        """
+        Convert `latex` by direct substitution if it consists only of plain text
+        and macros from `self._simple_macros`; otherwise return None.
+        """
+        pieces = []
+        pos = 0
+        prev_name = None
+        prev_post_space = ''
+        for m in _MACRO_TOKEN_RE.finditer(latex):
+            name = m.group(1)
+            if name is None:
+                name = m.group(3)
+            text = self._simple_macros.get(name)
+            if text is None:
+                return None
+
+            chars = latex[pos:m.start()]
+            if chars:
+                if not self._is_plain_chars(chars):
+                    return None
+                if prev_name is not None:
+                    pieces.append(prev_post_space)
+                pieces.append(chars)
+            elif prev_name in self._space_after_macros:
+                pieces.append(' ')
+            pieces.append(text)
+
+            post_space = m.group(2) or ''
+            pos = m.end()
+            if post_space.count('\n') >= 2:
+                # whitespace starting a new paragraph is not part of the macro
+                newline_pos = post_space.find('\n')
+                pos -= len(post_space) - newline_pos
+                post_space = post_space[:newline_pos]
+            prev_name = name
+            prev_post_space = post_space
+
+        if prev_name is None:
+            return None
+        chars = latex[pos:]
+        if chars:
+            if not self._is_plain_chars(chars):
+                return None
+            pieces.append(prev_post_space)
+            pieces.append(chars)
+        return ''.join(pieces)
+
     def latex_to_text(self, latex, **parse_flags):
         """Override to ensure our custom context is used during parsing."""
-        from pylatexenc import latexwalker
-        from pylatexenc.latexnodes import parsers as latexnodes_parsers
-        
+        # Plain text without any LaTeX markup converts to itself; skip parsing
+        if not self.fill_text and not latex.isspace() \
+           and self._latex_markup_re.search(latex) is None:
+            return latex
+
+        lone_macro = self._lone_macros.get(latex)
+        if lone_macro is not None:
+            if isinstance(lone_macro, str):
+                return lone_macro
+            return lone_macro(None, self)
+
+        text = self._substitute_simple_macros(latex)
+        if text is not None:
+            return text
+
         # Create LatexWalker with our custom context
-        lw = latexwalker.LatexWalker(latex, latex_context=self.latex_context, **parse_flags)
-        nodelist, _ = lw.parse_content(latexnodes_parsers.LatexGeneralNodesParser())
+        lw = LatexWalker(latex, latex_context=self.latex_context, **parse_flags)
+        nodelist, _ = lw.parse_content(_GENERAL_NODES_PARSER)
         return self.nodelist_to_text(nodelist)
 
 
-def custom_latex_to_text(latex_text):
+# Shared converter used by custom_latex_to_text(), created on first use
+_DEFAULT_CONVERTER = None
+
+
+def _get_default_converter():
+    """Return the shared converter, creating it if needed."""
+    global _DEFAULT_CONVERTER
+    if _DEFAULT_CONVERTER is None:
+        _DEFAULT_CONVERTER = CustomLatexNodes2Text(strict_latex_spaces="math-all-spaces")
+    return _DEFAULT_CONVERTER
+
+
+@functools.lru_cache(maxsize=8192)
+def _cached_latex_to_text(latex_text):
+    """Memoized conversion with the shared converter."""
+    return _get_default_converter().latex_to_text(latex_text)
+
+
+def custom_latex_to_text(latex_text, cache=False):
     """
     Convert LaTeX text to custom formatted text with variations.
     
     Args:
         latex_text (str): The LaTeX string to convert
+        cache (bool): If True, reuse the result of an earlier call on the same
+            string instead of converting it again.  Repeated inputs then all
+            get the same variation.
         
     Returns:
         str: The converted text with custom formatting
     """
-    converter = CustomLatexNodes2Text(strict_latex_spaces="math-all-spaces")
-    return converter.latex_to_text(latex_text)
+    if cache:
+        return _cached_latex_to_text(latex_text)
+    return _get_default_converter().latex_to_text(latex_text)
 
 
 def main():
@@ -535,13 +666,16 @@ def main():
     print("Custom LaTeX to Text Converter Demo")
     print("=" * 50)
     
+    # Build the converter once and reuse it for all test cases
+    converter = CustomLatexNodes2Text(strict_latex_spaces="math-all-spaces")
+    
     for i, latex in enumerate(test_cases, 1):
         print(f"\nTest {i}: {latex}")
         try:
             # Generate multiple variations to show randomness
             print("Variations:")
             for j in range(3):
-                result = custom_latex_to_text(latex)
+                result = converter.latex_to_text(latex)
                 print(f"  {j+1}: {result}")
         except Exception as e:
             print(f"  Error: {e}")
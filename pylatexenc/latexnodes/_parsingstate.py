@@ -38,10 +38,12 @@ logger = logging.getLogger(__name__)
 
 
 _unisafe_arrow_s = '→'
+_basestring = str
 ### BEGIN_PYTHON2_SUPPORT_CODE
 import sys
 if sys.version_info.major == 2:
     _unisafe_arrow_s = '->'
+    _basestring = basestring
 ### END_PYTHON2_SUPPORT_CODE
 
 
@@ -230,6 +232,9 @@ class ParsingState(object):
         self._parent_parsing_state_info = \
             kwargs.pop('_parent_parsing_state_info', (None, {}))
 
+        # sub-contexts already derived from this state, see _shared_sub_context()
+        self._sub_contexts = {}
+
         self.set_fields(**kwargs)
 
         self.finalize_state()
@@ -429,6 +434,36 @@ class ParsingState(object):
 
         return p
 
+    def _shared_sub_context(self, **kwargs):
+        r"""
+        Same as :py:meth:`sub_context()`, except that the returned parsing state
+        is shared with any other caller that requests the same changes on this
+        parsing state object.  It must therefore not be modified.
+
+        This is meant for internal parser code that derives the same sub-context
+        over and over (e.g. for each macro argument, or each math node).  Only
+        changes to simple values (bools, ints, strings, `None`) are shared, and
+        never changes to the string `s` being parsed, so that a parsing state
+        that is used for many documents does not accumulate sub-contexts.
+        """
+
+        if 's' in kwargs or \
+           not all(_is_simple_value(v) for v in kwargs.values()):
+            return self.sub_context(**kwargs)
+
+        # Transcrypt dictionaries only have string keys, so we build the key
+        # string ourselves.  repr() never contains a raw newline.
+        cache_key = "\n".join([
+            k + "=" + repr(kwargs[k])
+            for k in sorted(kwargs.keys())
+        ])
+
+        p = self._sub_contexts.get(cache_key, None)
+        if p is None:
+            p = self.sub_context(**kwargs)
+            self._sub_contexts[cache_key] = p
+        return p
+
 
     def get_fields(self):
         r"""
@@ -474,3 +509,6 @@ class ParsingState(object):
 
 def _safe_eq(a, b):
     return ((a is None and b is None) or a == b)
+
+def _is_simple_value(v):
+    return v is None or isinstance(v, (bool, int, _basestring))
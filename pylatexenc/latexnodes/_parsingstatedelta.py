@@ -71,11 +71,13 @@ class ParsingStateDelta(object):
         parsing state that reflects all the necessary changes.
 
         The new parsing state instance might be the same object instance as is
-        if no changes need to be applied.
+        if no changes need to be applied.  It might also be shared with other
+        parses that apply the same changes to the same `parsing_state`, so it
+        must not be modified.
         """
 
         if self.set_attributes:
-            return parsing_state.sub_context( **self.set_attributes )
+            return parsing_state._shared_sub_context( **self.set_attributes )
 
         return parsing_state    
 
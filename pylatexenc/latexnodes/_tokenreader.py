@@ -88,6 +88,11 @@ class LatexTokenReader(LatexTokenReaderBase):
 
         self._pos = 0
 
+        # (pos, parsing_state, token fields) of the last token read by
+        # peek_token(), so that peeking at the same token again does not
+        # require parsing it again
+        self._last_peeked = None
+
     def move_to_token(self, tok, rewind_pre_space=True):
         r"""
         Reimplemented from :py:meth:`LatexTokenReaderBase.move_to_token()`.
@@ -194,9 +199,32 @@ class LatexTokenReader(LatexTokenReaderBase):
         Reimplemented from :py:meth:`LatexTokenReaderBase.peek_token()`.
         """
 
+        pos = self._pos
+
+        last_peeked = self._last_peeked
+        if last_peeked is not None and last_peeked[0] == pos \
+           and last_peeked[1] is parsing_state:
+            # Return a new token instance, parsers are allowed to modify the
+            # tokens they read
+            tok_fields = last_peeked[2]
+            return self.make_token(
+                tok=tok_fields[0],
+                arg=tok_fields[1],
+                pos=tok_fields[2],
+                pos_end=tok_fields[3],
+                pre_space=tok_fields[4],
+                post_space=tok_fields[5],
+            )
+
         try:
             
-            return self.impl_peek_token(parsing_state)
+            tok = self.impl_peek_token(parsing_state)
+            self._last_peeked = (
+                pos,
+                parsing_state,
+                (tok.tok, tok.arg, tok.pos, tok.pos_end, tok.pre_space, tok.post_space),
+            )
+            return tok
 
         except LatexWalkerTokenParseError as exc:
             if self.tolerant_parsing:
@@ -368,25 +396,18 @@ class LatexTokenReader(LatexTokenReaderBase):
         # enable_double_newline_paragraphs = \
         #     parsing_state.enable_double_newline_paragraphs
 
-        space = ''
-
-        while True:
-            if p2 >= len(s):
-                break
-            c = s[p2]
-            if not c.isspace():
-                break
-            space += c
+        # find where the whitespace ends and slice it out once, rather than
+        # building up the space string character by character.  (We don't use
+        # a regex here because rx.match(s, pos) is not supported by
+        # Transcrypt.)
+        len_s = len(s)
+        while p2 < len_s and s[p2].isspace():
             p2 += 1
 
-            # ### new paragraphs handled differently now -- parser will count
-            # ### number of newlines in returned whitespace
-            #
-            # if space.endswith('\n\n') and enable_double_newline_paragraphs:
-            #     # two \n's indicate new paragraph.
-            #     space = space[:-2]
-            #     p2 = p2 - 2
-            #     break
+        space = s[pos:p2]
+
+        # ### new paragraphs handled differently now -- parser will count
+        # ### number of newlines in returned whitespace
 
         # encountered end of space
         return (space, pos, p2)
@@ -54,20 +54,37 @@ class LatexWalkerParsingStateEventHandler(object):
     """
 
     def enter_math_mode(self, math_mode_delimiter=None, trigger_token=None):
-        return ParsingStateDelta(
-            set_attributes=dict(
-                in_math_mode=True,
-                math_mode_delimiter=math_mode_delimiter
+        # the delta only depends on the delimiter, reuse it for all math modes
+        # opened with the same delimiter.  (Transcrypt dictionaries only have
+        # string keys, so use "" for math_mode_delimiter=None and prefix the
+        # actual delimiters.)
+        if math_mode_delimiter is None:
+            k = ""
+        else:
+            k = ":" + math_mode_delimiter
+        delta = _enter_math_mode_parsing_state_deltas.get(k, None)
+        if delta is None:
+            delta = ParsingStateDelta(
+                set_attributes=dict(
+                    in_math_mode=True,
+                    math_mode_delimiter=math_mode_delimiter
+                )
             )
-        )
+            _enter_math_mode_parsing_state_deltas[k] = delta
+        return delta
 
     def leave_math_mode(self, trigger_token=None):
-        return ParsingStateDelta(
-            set_attributes=dict(
-                in_math_mode=False,
-                math_mode_delimiter=None
-            )
-        )
+        return _leave_math_mode_parsing_state_delta
+
+
+_enter_math_mode_parsing_state_deltas = {}
+
+_leave_math_mode_parsing_state_delta = ParsingStateDelta(
+    set_attributes=dict(
+        in_math_mode=False,
+        math_mode_delimiter=None
+    )
+)
 
 
 _default_parsing_state_event_handler = LatexWalkerParsingStateEventHandler()
@@ -47,6 +47,39 @@ if sys.version_info.major == 2:
 
 
 
+def _make_node_fields(_fields, _redundant_fields):
+    fields = tuple(['pos', 'pos_end', 'parsing_state', 'latex_walker']
+                   + list(_fields))
+    if _redundant_fields is not None:
+        redundant_fields = tuple(list(fields) + ['len'] + list(_redundant_fields))
+    else:
+        redundant_fields = tuple(list(fields) + ['len'])
+    return (fields, redundant_fields)
+
+# The full `_fields` and `_redundant_fields` tuples of nodes, indexed by the
+# field names given by the node subclass.  They only depend on the node type,
+# so all nodes of a type share them.  (Keys are strings because Transcrypt
+# dictionaries only have string keys.)
+_node_fields = {}
+
+def _get_node_fields(_fields, _redundant_fields):
+    if not isinstance(_fields, tuple) or \
+       (_redundant_fields is not None and not isinstance(_redundant_fields, tuple)):
+        return _make_node_fields(_fields, _redundant_fields)
+
+    # field names are identifiers, so ' ' and '/' can't appear in them
+    k = " ".join(_fields)
+    if _redundant_fields is not None:
+        k += "/" + " ".join(_redundant_fields)
+
+    node_fields = _node_fields.get(k, None)
+    if node_fields is None:
+        node_fields = _make_node_fields(_fields, _redundant_fields)
+        _node_fields[k] = node_fields
+    return node_fields
+
+
+
 def _display_abbrev_str(s, maxlen=40):
     if not maxlen or maxlen < 2: # also catches None
         maxlen = 2
@@ -170,13 +203,8 @@ class LatexNode(object):
         if pos_end is None and len_ is not None:
             self.pos_end = self.pos + len_
 
-        self._fields = tuple(['pos', 'pos_end', 'parsing_state', 'latex_walker']
-                             + list(_fields))
-        if _redundant_fields is not None:
-            self._redundant_fields = tuple(list(self._fields) + ['len']
-                                           + list(_redundant_fields))
-        else:
-            self._redundant_fields = tuple(list(self._fields) + ['len'])
+        self._fields, self._redundant_fields = \
+            _get_node_fields(_fields, _redundant_fields)
 
     def nodeType(self):
         """
@@ -213,7 +241,9 @@ class LatexNode(object):
         return self.latex_walker.s[self.pos : self.pos_end]
 
     def __eq__(self, other):
-        return (
+        if other is self:
+            return True
+        if not (
             other is not None  and
             isinstance(other, LatexNode) and
             self.nodeType() is other.nodeType()  and
@@ -223,15 +253,20 @@ class LatexNode(object):
             # comparison are there for transcrypt ...
             ((other.pos is None and self.pos is None) or other.pos == self.pos)  and
             ((other.pos_end is None and self.pos_end is None)
-             or other.pos_end == self.pos_end)  and
-            all(
-                (
-                    ( (getattr(self, f) is None and getattr(other, f) is None)
-                      or getattr(self, f) == getattr(other, f) )
-                    for f in self._fields
-                )
-            )
-        )
+             or other.pos_end == self.pos_end)
+        ):
+            return False
+        # compare the remaining fields, stopping at the first mismatch.  Fields
+        # that refer to the same object (e.g. a shared spec or delimiters, or
+        # both None) need not be compared further.
+        for f in self._fields:
+            x = getattr(self, f)
+            y = getattr(other, f)
+            if x is y:
+                continue
+            if x is None or y is None or not (x == y):
+                return False
+        return True
 
     # see https://docs.python.org/3/library/constants.html#NotImplemented
     def __ne__(self, other): return NotImplemented
@@ -1250,6 +1285,8 @@ class LatexNodeList(object):
 
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, list):
             return self.nodelist == other
         return (
@@ -56,6 +56,26 @@ if sys.version_info.major == 2:
 
 
 
+# delimiters pairs that were built while parsing, indexed by opening and then
+# by closing delimiter; all group nodes with the same delimiters share the
+# same tuple instance.  (Transcrypt dictionaries only have string keys, and a
+# string-coerced (opening, closing) tuple key would collide for e.g. ('', ',')
+# and (',', ''), hence the nested dictionaries.)
+_delimiters_pairs = {}
+
+def _get_delimiters_pair(opening_delimiter, closing_delimiter):
+    by_closing_delimiter = _delimiters_pairs.get(opening_delimiter, None)
+    if by_closing_delimiter is None:
+        by_closing_delimiter = {}
+        _delimiters_pairs[opening_delimiter] = by_closing_delimiter
+    pair = by_closing_delimiter.get(closing_delimiter, None)
+    if pair is None:
+        pair = (opening_delimiter, closing_delimiter)
+        by_closing_delimiter[closing_delimiter] = pair
+    return pair
+
+
+
 
 # ------------------------------------------------------------------------------
 
@@ -542,7 +562,7 @@ class LatexDelimitedExpressionParserInfo(object):
         if isinstance(delimiters, _basestring):
             opening_delimiter = delimiters
             closing_delimiter = self.get_matching_delimiter(opening_delimiter)
-            return (opening_delimiter, closing_delimiter)
+            return _get_delimiters_pair(opening_delimiter, closing_delimiter)
 
         return delimiters
 
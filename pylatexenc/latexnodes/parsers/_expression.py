@@ -94,7 +94,7 @@ class LatexExpressionParser(LatexParserBase):
 
     def parse(self, latex_walker, token_reader, parsing_state, **kwargs):
 
-        expr_parsing_state = parsing_state.sub_context(enable_environments=False)
+        expr_parsing_state = parsing_state._shared_sub_context(enable_environments=False)
         
         exprnodes = []
         while True:
@@ -35,6 +35,7 @@ logger = logging.getLogger(__name__)
 from ._base import LatexParserBase
 from ._delimited import (
     LatexDelimitedGroupParser,
+    _get_delimiters_pair,
 )
 from ._expression import LatexExpressionParser
 from ..nodes import (
@@ -193,6 +194,16 @@ class LatexOptionalCharsMarkerParser(LatexParserBase):
                       parsing_state, **kwargs):
         
         orig_pos_tok = token_reader.peek_token(parsing_state=parsing_state)
+
+        # quick check on the token we just peeked at, for the common case where
+        # the marker is absent: markers can only start with a char or a
+        # specials token
+        if orig_pos_tok.tok not in ('char', 'specials') \
+           or (len(orig_pos_tok.pre_space) and not self.allow_pre_space):
+            token_reader.move_to_token(orig_pos_tok)
+            logger.debug("No chars marker found!",)
+            return None, None, None, orig_pos_tok.pos
+
         pos_end = None
         read_s = ''
         match_found = False
@@ -267,7 +278,7 @@ class LatexOptionalCharsMarkerParser(LatexParserBase):
                 latex_walker.make_node(
                     LatexGroupNode,
                     parsing_state=parsing_state,
-                    delimiters=(matched_chars, ''),
+                    delimiters=_get_delimiters_pair(matched_chars, ''),
                     nodelist=final_nl,
                     pos=arg_pos,
                     pos_end=final_nl_pos_end,
@@ -43,6 +43,7 @@ from ._delimited import (
     LatexDelimitedGroupParserInfo,
     LatexDelimitedGroupParser,
     LatexDelimitedMultiDelimGroupParser,
+    _get_delimiters_pair,
 )
 from ._optionals import (
     LatexOptionalCharsMarkerParser, LatexOptionalEmbellishmentArgsParser
@@ -130,121 +131,31 @@ class LatexStandardArgumentParser(LatexParserBase):
 
     def get_arg_parser_instance(self, arg_spec):
 
-        if arg_spec in ('m', '{'):
-
-            return LatexExpressionParser(
-                return_full_node_list=self.return_full_node_list,
-                single_token_requiring_arg_is_error=\
-                    self.expression_single_token_requiring_arg_is_error,
-                allow_pre_space=self.allow_pre_space,
-                allow_pre_comments=self.allow_pre_space,
-            )
-
-        elif arg_spec in ('o', '['):
-
-            return LatexDelimitedGroupParser(
-                delimiters=('[',']',),
-                optional=True,
-                allow_pre_space=self.allow_pre_space,
-            )
-
-        elif arg_spec in ('s', '*'):
-
-            return LatexOptionalCharsMarkerParser(
-                chars_list=['*'],
-                allow_pre_space=self.allow_pre_space,
-                return_full_node_list=self.return_full_node_list,
-            )
-
-        elif arg_spec.startswith('e'):
-        
-            arg_spec_arg = arg_spec[1:].strip()
-
-            if len(arg_spec_arg) <= 2 or \
-               arg_spec_arg[0] != '{' or arg_spec_arg[len(arg_spec_arg)-1] != '}':
-                raise ValueError("Expected embellishment chars with syntax ‘e{<chars>}’ in "
-                                 + "arg_spec; got ‘{}’".format(arg_spec))
-
-            embellishment_chars = arg_spec_arg[1:len(arg_spec)-1]
-
-            return LatexOptionalEmbellishmentArgsParser(
-                embellishment_chars=embellishment_chars,
-                allow_pre_space=self.allow_pre_space,
-            )
-
-        elif arg_spec.startswith('t'):
-            # arg_spec = 't<char>', an optional token marker
-            if len(arg_spec) != 2:
-                raise ValueError("arg_spec for an optional char argument should "
-                                 "be of the form ‘t<char>’")
-            the_char = arg_spec[1]
-
-            return LatexOptionalCharsMarkerParser(
-                chars_list=[the_char],
-                allow_pre_space=self.allow_pre_space,
-            )
-
-        elif arg_spec.startswith('r'):
-            # arg_spec = 'r<char1><char2>', required delimited argument
-            if len(arg_spec) != 3:
-                raise ValueError("arg_spec for a required delimited argument should "
-                                 "be of the form ‘r<char1><char2>’")
-            open_char = arg_spec[1]
-            close_char = arg_spec[2]
-
-            return LatexDelimitedGroupParser(
-                delimiters=(open_char, close_char,),
-                optional=False,
-                allow_pre_space=self.allow_pre_space,
-            )
-
-        elif arg_spec.startswith('d'):
-            # arg_spec = 'd<char1><char2>', optional delimited argument
-            if len(arg_spec) != 3:
-                raise ValueError("arg_spec for an optional delimited argument should "
-                                 "be of the form ‘d<char1><char2>’")
-            open_char = arg_spec[1]
-            close_char = arg_spec[2]
-
-            return LatexDelimitedGroupParser(
-                delimiters=(open_char, close_char,),
-                optional=True,
-                allow_pre_space=self.allow_pre_space,
-            )
-
-        elif arg_spec.startswith('v'):
-            # arg_spec = 'v' or 'v<char1><char2>', a verbatim argument with
-            # automatically detected delimiters or specific delimiters
-            if len(arg_spec) == 1:
-                delimiter_chars = None # autodetect
-            elif len(arg_spec) == 3:
-                delimiter_chars = (arg_spec[1], arg_spec[2])
-            else:
-                raise ValueError("arg_spec for a verbatim argument should be either ‘v’ "
-                                 "or ‘v<char1><char2>’")
-            return LatexDelimitedVerbatimParser(
-                delimiters=delimiter_chars,
-            )
-
-
-        elif arg_spec == 'AnyDelimited':
-
-            return LatexDelimitedMultiDelimGroupParser(
-                optional=False,
-                allow_pre_space=self.allow_pre_space,
-            )
-
-        elif arg_spec == 'AnyDelimitedOptional':
-
-            return LatexDelimitedMultiDelimGroupParser(
-                optional=True,
-                allow_pre_space=self.allow_pre_space,
-            )
-
-        else:
-            
+        # string key (Transcrypt dictionaries only have string keys): one
+        # character per option flag, followed by the arg_spec
+        k = "".join([
+            ('1' if flag else '0')
+            for flag in (self.return_full_node_list,
+                         self.expression_single_token_requiring_arg_is_error,
+                         self.allow_pre_space)
+        ]) + arg_spec
+
+        arg_parser = _std_arg_parser_arg_parser_instances.get(k, None)
+        if arg_parser is not None:
+            return arg_parser
+
+        # exact specs first, then specs identified by their first character
+        # (e.g. 'e{...}', 'r<char1><char2>')
+        make_arg_parser = _std_arg_parser_makers_by_spec.get(arg_spec, None)
+        if make_arg_parser is None:
+            make_arg_parser = _std_arg_parser_makers_by_prefix.get(arg_spec[:1], None)
+        if make_arg_parser is None:
             raise ValueError("Unknown argument specification: {!r}".format(arg_spec))
 
+        arg_parser = make_arg_parser(self, arg_spec)
+        _std_arg_parser_arg_parser_instances[k] = arg_parser
+        return arg_parser
+
 
     def parse(self, latex_walker, token_reader, parsing_state, **kwargs):
 
@@ -267,6 +178,141 @@ class LatexStandardArgumentParser(LatexParserBase):
 
 
 
+# The makers below create the underlying parser for a given `arg_spec` of a
+# LatexStandardArgumentParser instance `p`.
+
+def _make_expression_arg_parser(p, arg_spec):
+    return LatexExpressionParser(
+        return_full_node_list=p.return_full_node_list,
+        single_token_requiring_arg_is_error=\
+            p.expression_single_token_requiring_arg_is_error,
+        allow_pre_space=p.allow_pre_space,
+        allow_pre_comments=p.allow_pre_space,
+    )
+
+def _make_optional_bracket_arg_parser(p, arg_spec):
+    return LatexDelimitedGroupParser(
+        delimiters=('[',']',),
+        optional=True,
+        allow_pre_space=p.allow_pre_space,
+    )
+
+def _make_optional_star_arg_parser(p, arg_spec):
+    return LatexOptionalCharsMarkerParser(
+        chars_list=['*'],
+        allow_pre_space=p.allow_pre_space,
+        return_full_node_list=p.return_full_node_list,
+    )
+
+def _make_embellishments_arg_parser(p, arg_spec):
+    arg_spec_arg = arg_spec[1:].strip()
+
+    if len(arg_spec_arg) <= 2 or \
+       arg_spec_arg[0] != '{' or arg_spec_arg[len(arg_spec_arg)-1] != '}':
+        raise ValueError("Expected embellishment chars with syntax ‘e{<chars>}’ in "
+                         + "arg_spec; got ‘{}’".format(arg_spec))
+
+    embellishment_chars = arg_spec_arg[1:len(arg_spec)-1]
+
+    return LatexOptionalEmbellishmentArgsParser(
+        embellishment_chars=embellishment_chars,
+        allow_pre_space=p.allow_pre_space,
+    )
+
+def _make_optional_token_arg_parser(p, arg_spec):
+    # arg_spec = 't<char>', an optional token marker
+    if len(arg_spec) != 2:
+        raise ValueError("arg_spec for an optional char argument should "
+                         "be of the form ‘t<char>’")
+    the_char = arg_spec[1]
+
+    return LatexOptionalCharsMarkerParser(
+        chars_list=[the_char],
+        allow_pre_space=p.allow_pre_space,
+    )
+
+def _make_required_delimited_arg_parser(p, arg_spec):
+    # arg_spec = 'r<char1><char2>', required delimited argument
+    if len(arg_spec) != 3:
+        raise ValueError("arg_spec for a required delimited argument should "
+                         "be of the form ‘r<char1><char2>’")
+    open_char = arg_spec[1]
+    close_char = arg_spec[2]
+
+    return LatexDelimitedGroupParser(
+        delimiters=(open_char, close_char,),
+        optional=False,
+        allow_pre_space=p.allow_pre_space,
+    )
+
+def _make_optional_delimited_arg_parser(p, arg_spec):
+    # arg_spec = 'd<char1><char2>', optional delimited argument
+    if len(arg_spec) != 3:
+        raise ValueError("arg_spec for an optional delimited argument should "
+                         "be of the form ‘d<char1><char2>’")
+    open_char = arg_spec[1]
+    close_char = arg_spec[2]
+
+    return LatexDelimitedGroupParser(
+        delimiters=(open_char, close_char,),
+        optional=True,
+        allow_pre_space=p.allow_pre_space,
+    )
+
+def _make_verbatim_arg_parser(p, arg_spec):
+    # arg_spec = 'v' or 'v<char1><char2>', a verbatim argument with
+    # automatically detected delimiters or specific delimiters
+    if len(arg_spec) == 1:
+        delimiter_chars = None # autodetect
+    elif len(arg_spec) == 3:
+        delimiter_chars = (arg_spec[1], arg_spec[2])
+    else:
+        raise ValueError("arg_spec for a verbatim argument should be either ‘v’ "
+                         "or ‘v<char1><char2>’")
+    return LatexDelimitedVerbatimParser(
+        delimiters=delimiter_chars,
+    )
+
+def _make_any_delimited_arg_parser(p, arg_spec):
+    return LatexDelimitedMultiDelimGroupParser(
+        optional=False,
+        allow_pre_space=p.allow_pre_space,
+    )
+
+def _make_any_delimited_optional_arg_parser(p, arg_spec):
+    return LatexDelimitedMultiDelimGroupParser(
+        optional=True,
+        allow_pre_space=p.allow_pre_space,
+    )
+
+
+_std_arg_parser_makers_by_spec = {
+    'm': _make_expression_arg_parser,
+    '{': _make_expression_arg_parser,
+    'o': _make_optional_bracket_arg_parser,
+    '[': _make_optional_bracket_arg_parser,
+    's': _make_optional_star_arg_parser,
+    '*': _make_optional_star_arg_parser,
+    'AnyDelimited': _make_any_delimited_arg_parser,
+    'AnyDelimitedOptional': _make_any_delimited_optional_arg_parser,
+}
+
+_std_arg_parser_makers_by_prefix = {
+    'e': _make_embellishments_arg_parser,
+    't': _make_optional_token_arg_parser,
+    'r': _make_required_delimited_arg_parser,
+    'd': _make_optional_delimited_arg_parser,
+    'v': _make_verbatim_arg_parser,
+}
+
+# Parsers created by LatexStandardArgumentParser.get_arg_parser_instance(),
+# keyed by arg_spec and the options the makers above use.  Parsers keep no
+# state between parses, so all standard argument parsers with the same
+# arg_spec and options share one.
+_std_arg_parser_arg_parser_instances = {}
+
+
+
 # --------------------------------------------------------------------
 
 
@@ -398,6 +444,9 @@ class _CommaSepContentCustomParser(LatexParserBase):
                 )
             ),
         )
+        # delimiters checked on every token by stop_token_condition()
+        self.close_delimiter = contents_parser_info.parsed_delimiters[1]
+        self.comma_char = contents_parser_info.comma_char
         # A specific parser instance of this type cannot be re-used
         # reliably !  (Nor will it ever be.)
         self.current_parsing_state = self.contents_parser_info.contents_parsing_state
@@ -411,16 +460,13 @@ class _CommaSepContentCustomParser(LatexParserBase):
         self.last_element_pos_end = None
 
     def stop_token_condition(self, token):
-        logger.debug("stop_token_condition: %r", token)
-        if token.tok == 'brace_close' \
-           and token.arg == self.contents_parser_info.parsed_delimiters[1]:
-            return True
-        if token.tok == 'char':
-            if token.arg == self.contents_parser_info.parsed_delimiters[1]:
-                return True
-            elif token.arg == self.contents_parser_info.comma_char:
-                return True
-            return False
+        # called on every token of the list, keep this cheap (no logging here)
+        tok = token.tok
+        if tok == 'brace_close':
+            return token.arg == self.close_delimiter
+        if tok == 'char':
+            arg = token.arg
+            return arg == self.close_delimiter or arg == self.comma_char
         return False
 
     def handle_stop_condition_token(self, token,
@@ -506,7 +552,7 @@ class _CommaSepContentCustomParser(LatexParserBase):
             LatexGroupNode,
             nodelist=nodelist,
             parsing_state=self.current_parsing_state,
-            delimiters=('', this_close_delim),
+            delimiters=_get_delimiters_pair('', this_close_delim),
             pos=self.last_element_pos_start,
             pos_end=pos_end
         )
@@ -691,7 +737,7 @@ class LatexTackOnInformationFieldMacrosParser(LatexParserBase):
             arg_node = latex_walker.make_node(
                 LatexGroupNode,
                 parsing_state=parsing_state,
-                delimiters=('\\'+macroname, ''),
+                delimiters=_get_delimiters_pair('\\'+macroname, ''),
                 nodelist=arg_content_nodelist,
                 pos=tok.pos,
                 pos_end=(
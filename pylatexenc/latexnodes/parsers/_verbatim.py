@@ -189,8 +189,6 @@ class LatexDelimitedVerbatimParser(LatexVerbatimBaseParser):
                 '(': ')',
             }
 
-        self.depth_counter = 1
-
         # will be determined upon encountering the open delimiter
         self.parsed_delimiters = None
 
@@ -204,15 +202,15 @@ class LatexDelimitedVerbatimParser(LatexVerbatimBaseParser):
         if char is None:
             return False
 
-        if char == verbatim_info.parsed_delimiters[1]:
+        if char == verbatim_info.close_delim_char:
             # closing delimiter
-            self.depth_counter -= 1
-            if self.depth_counter <= 0:
+            verbatim_info.depth_counter -= 1
+            if verbatim_info.depth_counter <= 0:
                 # final closing delimiter
                 return True
-        elif char == verbatim_info.parsed_delimiters[0]:
+        elif char == verbatim_info.open_delim_char:
             # opening delimiter, if not the same as the closing delimiter
-            self.depth_counter += 1
+            verbatim_info.depth_counter += 1
 
         return False
 
@@ -251,6 +249,12 @@ class LatexDelimitedVerbatimParser(LatexVerbatimBaseParser):
                     },
                 )
             
+        # the delimiter depth is tracked per parse, the parser instance itself
+        # may be shared (see get_standard_argument_parser())
+        verbatim_info.open_delim_char = verbatim_info.parsed_delimiters[0]
+        verbatim_info.close_delim_char = verbatim_info.parsed_delimiters[1]
+        verbatim_info.depth_counter = 1
+
         verbatim_node, _ = \
             self.read_verbatim_content(latex_walker, token_reader, parsing_state,
                                        verbatim_info=verbatim_info, **kwargs)
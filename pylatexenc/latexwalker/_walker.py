@@ -50,6 +50,8 @@ from ._get_defaultspecs import get_default_latex_context_db
 
 from ..latexnodes import ParsingState
 
+from ._helpers import _basestring
+
 
 import logging
 logger = logging.getLogger(__name__)
@@ -68,6 +70,11 @@ fn_unique_object_id = id
 _legacy_pyltxenc1_do = lambda *args: None
 
 
+# group and math parsers used by LatexWalker, keyed by their delimiters
+_latex_group_parsers = {}
+_latex_math_parsers = {}
+
+
 
 # ------------------------------------------------------------------------------
 
@@ -267,9 +274,39 @@ class LatexWalker(latexnodes.LatexWalkerBase):
         super(LatexWalker, self).__init__()
 
 
-    make_latex_group_parser = parsers.LatexDelimitedGroupParser
+    def make_latex_group_parser(self, delimiters):
+        r"""
+        Return a :py:class:`~pylatexenc.latexnodes.parsers.LatexDelimitedGroupParser`
+        instance for a group with the given `delimiters`.
 
-    make_latex_math_parser = parsers.LatexMathParser
+        Parsers keep no state between parses, so the instance is shared by all
+        groups with the same (string) delimiters.
+        """
+        if not isinstance(delimiters, _basestring):
+            return parsers.LatexDelimitedGroupParser(delimiters=delimiters)
+        group_parser = _latex_group_parsers.get(delimiters, None)
+        if group_parser is None:
+            group_parser = parsers.LatexDelimitedGroupParser(delimiters=delimiters)
+            _latex_group_parsers[delimiters] = group_parser
+        return group_parser
+
+    def make_latex_math_parser(self, math_mode_delimiters):
+        r"""
+        Return a :py:class:`~pylatexenc.latexnodes.parsers.LatexMathParser`
+        instance for math mode with the given `math_mode_delimiters`.
+
+        As for :py:meth:`make_latex_group_parser()`, the instance is shared by
+        all math nodes with the same (string) delimiters.
+        """
+        if not isinstance(math_mode_delimiters, _basestring):
+            return parsers.LatexMathParser(math_mode_delimiters=math_mode_delimiters)
+        math_parser = _latex_math_parsers.get(math_mode_delimiters, None)
+        if math_parser is None:
+            math_parser = parsers.LatexMathParser(
+                math_mode_delimiters=math_mode_delimiters
+            )
+            _latex_math_parsers[math_mode_delimiters] = math_parser
+        return math_parser
 
 
     def make_parsing_state(self, **kwargs):
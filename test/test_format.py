@@ -0,0 +1,74 @@
+import unittest
+import random
+import logging
+
+from pylatexenc.latexwalker import LatexWalker
+from pylatexenc.latexnodes.parsers import LatexGeneralNodesParser
+
+import format
+
+
+
+def _full_parse_to_text(converter, latex):
+    # what latex_to_text() does when no shortcut applies
+    lw = LatexWalker(latex, latex_context=converter.latex_context)
+    nodelist, _ = lw.parse_content(LatexGeneralNodesParser())
+    return converter.nodelist_to_text(nodelist)
+
+
+class TestSubstituteSimpleMacros(unittest.TestCase):
+
+    # pieces combined into test inputs: plain text, macros with a fixed
+    # replacement (including \cap and \in, which get an extra space in
+    # math-all-spaces mode), various spacing and paragraph breaks
+    pieces = [
+        'a', 'x y', 'b.', ' ', '  ', '\n', '\n\n', ' \n \n ', '\t',
+        r'\cap', r'\in', r'\cdot', r'\quad', r'\leq', r'\ldots', r'\sum',
+        r'\cap ', '\\in\n', '\\cdot\n\n', r'\leq  ',
+    ]
+
+    def _check_same_as_full_parse(self, strict_latex_spaces):
+        converter = format.CustomLatexNodes2Text(
+            strict_latex_spaces=strict_latex_spaces
+        )
+        rnd = random.Random(1234)
+        num_substituted = 0
+        for j in range(3000):
+            latex = "".join([ rnd.choice(self.pieces)
+                              for k in range(rnd.randint(1, 8)) ])
+            text = converter._substitute_simple_macros(latex)
+            if text is None:
+                continue
+            num_substituted += 1
+            self.assertEqual(text, _full_parse_to_text(converter, latex),
+                             msg="input {!r}, strict_latex_spaces={!r}"
+                             .format(latex, strict_latex_spaces))
+        return num_substituted
+
+    def test_based_on_source(self):
+        self.assertGreater(self._check_same_as_full_parse('based-on-source'), 0)
+
+    def test_math_all_spaces(self):
+        self.assertGreater(self._check_same_as_full_parse('math-all-spaces'), 0)
+
+    def test_macros(self):
+        # spaces between macros and chars are handled by the parser in this
+        # mode, the shortcut must not be used
+        self.assertEqual(self._check_same_as_full_parse('macros'), 0)
+
+    def test_except_in_equations(self):
+        self.assertEqual(self._check_same_as_full_parse('except-in-equations'), 0)
+
+    def test_paragraphs_and_macro_spacing(self):
+        converter = format.CustomLatexNodes2Text(strict_latex_spaces='math-all-spaces')
+        for latex in [ 'a\\cap b', 'a \\cap  b', '\\cap\\in x', 'a\\cdot\n\nb',
+                       'x\\quad\n  y', '\\leq\n\n\n z', 'a\\in\\cap b' ]:
+            self.assertIsNotNone(converter._substitute_simple_macros(latex))
+            self.assertEqual(converter.latex_to_text(latex),
+                             _full_parse_to_text(converter, latex))
+
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main()
@@ -132,6 +132,41 @@ class TestLatexNodeClasses(unittest.TestCase):
             r"inline math ‘\(…\)’"
         )
 
+    def test_eq(self):
+
+        n = LatexGroupNode(
+            delimiters=('{', '}'),
+            nodelist=LatexNodeList([ LatexCharsNode(chars='ab', pos=1, pos_end=3) ]),
+            pos=0,
+            pos_end=4,
+        )
+        self.assertTrue(n == n)
+        self.assertEqual(
+            n,
+            LatexGroupNode(
+                delimiters=('{', '}'),
+                nodelist=LatexNodeList([ LatexCharsNode(chars='ab', pos=1, pos_end=3) ]),
+                pos=0,
+                pos_end=4,
+            )
+        )
+        self.assertFalse(
+            n == LatexGroupNode(
+                delimiters=('{', '}'),
+                nodelist=LatexNodeList([ LatexCharsNode(chars='ac', pos=1, pos_end=3) ]),
+                pos=0,
+                pos_end=4,
+            )
+        )
+        self.assertFalse(
+            n == LatexGroupNode(
+                delimiters=('{', '}'),
+                nodelist=None,
+                pos=0,
+                pos_end=4,
+            )
+        )
+
 
 class TestLatexNodeList(unittest.TestCase):
 
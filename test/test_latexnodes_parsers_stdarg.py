@@ -370,6 +370,19 @@ class TestLatexStandardArgumentParser(unittest.TestCase):
 
         self.assertIsNone(nodes)
 
+    def test_arg_parser_instance_shared(self):
+        parser1 = LatexStandardArgumentParser(arg_spec=r'e{_^`}')
+        parser2 = LatexStandardArgumentParser(arg_spec=r'e{_^`}')
+        parser3 = LatexStandardArgumentParser(arg_spec=r'e{_^`}',
+                                              allow_pre_space=False)
+
+        arg_parser = parser1.get_arg_parser_instance(parser1.arg_spec)
+        self.assertIs(parser2.get_arg_parser_instance(parser2.arg_spec), arg_parser)
+        self.assertIsNot(parser3.get_arg_parser_instance(parser3.arg_spec), arg_parser)
+        self.assertFalse(
+            parser3.get_arg_parser_instance(parser3.arg_spec).allow_pre_space
+        )
+
 
     def test_arg_any_delimited_angleb(self):
         latextext = r'''<delimited>more stuff'''
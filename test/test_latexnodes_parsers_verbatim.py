@@ -196,6 +196,22 @@ class TestLatexDelimitedVerbatimParser(unittest.TestCase):
             )
         )
 
+    def test_nested_delimiters_parser_reused(self):
+        latextext = "{a{b}c}"
+
+        parser = LatexDelimitedVerbatimParser()
+
+        for j in range(2):
+            tr = LatexTokenReader(latextext)
+            ps = ParsingState(s=latextext, latex_context=DummyLatexContextDb())
+            lw = DummyWalker()
+
+            node, parsing_state_delta = \
+                lw.parse_content(parser, token_reader=tr, parsing_state=ps)
+
+            self.assertEqual(node.nodelist[0].chars, 'a{b}c')
+            self.assertEqual(node.pos_end, len(latextext))
+
     def test_special_contents(self):
         latextext = r"""<\$%*~+
 
@@ -14,6 +14,9 @@ from pylatexenc.latexnodes import (
     ParsingState
 )
 
+from ._helpers_tests import (
+    DummyLatexContextDb,
+)
 
 
 class TestLatexTokenReader(unittest.TestCase):
@@ -662,7 +665,54 @@ Some sneaky stuff can happen with consecutive math modes like here: $\zeta$$\gam
 
         with self.assertRaises(LatexWalkerEndOfStream):
             c = tr.next_chars(1, ps)
-            
+
+    def test_peek_token_again(self):
+        latextext = r"\somemacro and $math$"
+
+        tr = LatexTokenReader(latextext)
+        ps = ParsingState(s=latextext)
+
+        tok = tr.peek_token(ps)
+        self.assertEqual(tr.peek_token(ps), tok)
+        self.assertEqual(tr.next_token(ps), tok)
+
+        self.assertEqual(tr.peek_token(ps),
+                         LatexToken(tok='char', arg='a',
+                                    pos=len(r'\somemacro '),
+                                    pos_end=len(r'\somemacro a'),
+                                    pre_space=''))
+
+        # a different parsing state reads the token anew
+        tr.move_to_pos_chars(len(r'\somemacro and '))
+        self.assertEqual(tr.peek_token(ps),
+                         LatexToken(tok='mathmode_inline', arg='$',
+                                    pos=len(r'\somemacro and '),
+                                    pos_end=len(r'\somemacro and $'),
+                                    pre_space=''))
+        ps_nomath = ps.sub_context(enable_math=False)
+        self.assertEqual(tr.peek_token(ps_nomath),
+                         LatexToken(tok='char', arg='$',
+                                    pos=len(r'\somemacro and '),
+                                    pos_end=len(r'\somemacro and $'),
+                                    pre_space=''))
+
+    def test_peek_token_again_after_modified(self):
+        latextext = r"~x"
+
+        tr = LatexTokenReader(latextext)
+        ps = ParsingState(s=latextext, latex_context=DummyLatexContextDb())
+
+        tok = tr.peek_token(ps)
+        self.assertEqual(tok.tok, 'specials')
+        # some parsers modify the tokens they read; make sure this doesn't
+        # affect the token read at the same position again
+        tok.tok = 'char'
+        tok.arg = '~'
+        tok2 = tr.peek_token(ps)
+        self.assertIsNot(tok2, tok)
+        self.assertEqual(tok2.tok, 'specials')
+        self.assertEqual(tok2.arg.specials_chars, '~')
+
 
 
 